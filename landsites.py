@@ -35,7 +35,7 @@ LAND_NAMES = [
 ]
 
 
-@dataclass
+@dataclass(slots=True)
 class Land:
 
     name: str
@@ -59,6 +59,11 @@ class Land:
     def get_guardians(self) -> int:
         return self.guardians
 
+    def get_ratio(self) -> float:
+        # Computed from the fields on every call, so direct writes to gold or guardians are seen.
+        # A land without gold sorts last.
+        return self.guardians / self.gold if self.gold else float("inf")
+
     def set_gold(self, new_gold: float) -> None:
         self.gold = new_gold
 
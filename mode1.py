@@ -1,25 +1,31 @@
+from bisect import bisect_left, bisect_right
+from itertools import accumulate, compress
 from landsites import Land
-from data_structures.bst import BSTInOrderIterator, BinarySearchTree
-from algorithms.mergesort import mergesort
-from data_structures.node import TreeNode
 
 class Mode1Navigator:
     """
     A class to manage and navigate through a collection of Land objects for obtaining maximum rewards.
     
     Attributes
-        sites (BinarySearchTree): A BST containing Land objects sorted by guardians-to-gold ratio.
+        sites (list): Land objects sorted by guardians-to-gold ratio.
+        ratios (list): The guardians-to-gold ratio of each Land object, parallel to sites.
+        gold (list): The gold of each Land object, parallel to sites.
+        guardians (list): The guardians of each Land object, parallel to sites.
+        guardians_prefix (list): Running totals of guardians, parallel to sites.
+        gold_prefix (list): Running totals of gold, parallel to sites.
         total_adventurers (int): Total number of adventurers available for navigation.
-        
+        _pending (dict): Updated Land objects waiting to be re-inserted, mapped from their id to their index in the arrays.
+    
     Behaviours
-        __init__(self, sites, adventurers): Initialises the class with a sorted list of Land objects, append it to the BST and initialise total adventurers.
+        __init__(self, sites, adventurers): Initialises the class with a sorted list of Land objects, splits it into parallel arrays and initialise total adventurers.
         select_sites(self): Selects the most optimal path for the navigator based on available adventurers.
         select_sites_from_adventure_numbers(self, adventure_numbers): Calculates the maximum reward acheived from the optimal path taken for each total adventurers.
-        update_site(self, land, new_reward, new_guardian): Updates the states of a Land site and re-inserts into the BST.
-        
+        update_site(self, land, new_reward, new_guardian): Updates the states of a Land site and marks it to be re-inserted into the parallel arrays.
+    
     Other methods
-        _create_bst(self, l): Constructs a BST from a sorted list of Land objects.
-        _append_to_bst(self, bst, l, start, end, incrementer): Appends items to the BST in a specified order.
+        _apply_pending_updates(self): Re-inserts every updated Land site into the parallel arrays at once.
+        _build_arrays(self, sorted_sites): Splits the sorted Land sites into the parallel arrays and computes their running totals.
+        _compute_prefix_sums(self): Recomputes the running totals of guardians and gold.
         main(): Main method of the class.
     
     Example
@@ -40,27 +46,33 @@ class Mode1Navigator:
     
     Time Complexity
         __init__() -> O(N log N)
-            - Used merge sorting algorithm to sort the list of Land objects with the ratio of guardians to gold. >> O(N log N)
-            - Added the median Land object to the BST. >> O(log N)
-            - Iterated through the elements left to the median Land object. >> O(N log N)
-            - Iterated through the elements right to the median Land object. >> O(N log N)
-            - Overall: N log N + log N + N log N + N log N = 3 * N log N + log N => O(N log N) as 3 is constant and N log N > log N asymptotically.
-        
-       select_sites() -> O(1) to O(N)
-            - Created an Iterator object to yield values in O(1) time (initial setup complexity not required.)
-            - Uses a while loop to return node object at each iteration; minimum adventurers calculation done inside method.
-            - Best case = O(1) when the first land site obtained is enough to accomodate all adventurers.
-            - Worst case = O(N) when the navigator invades all land sites with enough adventurers.
+            - Used the built-in stable sort to sort the list of Land objects with the ratio of guardians to gold. >> O(N log N)
+            - Split the sorted Land objects into parallel arrays of ratios, gold and guardians. >> O(N)
+            - Computed the running totals of guardians and gold. >> O(N)
+            - Overall: N log N + N + N => O(N log N) as N log N > N asymptotically.
+       
+       select_sites() -> O(1) to O(N + P log P)
+            - Re-inserts the P sites updated since the last selection, if any. >> O(N + P log P)
+            - Scans the parallel arrays in sorted order; minimum adventurers calculation done inside method.
+            - Best case = O(1) when no site is pending and the first land site obtained is enough to accomodate all adventurers.
+            - Worst case = O(N + P log P + N) = O(N + P log P) when sites are pending, and the navigator invades all land sites with enough adventurers.
        
-       select_sites_from_adventure_numbers() -> O(A) to O(A * N)
+       select_sites_from_adventure_numbers() -> O(A log N) to O(N + P log P + A log N)
+            - Re-inserts the P sites updated since the last selection, if any. >> O(N + P log P)
             - Loops through the entire adventurer total list. >> O(A)
-            - Best case = O(1) when the first land encountered is enough to accomodate all adventurer totals.
-            - Worst case = O(N) when all adventurer totals invade all land sites present in the BST.
-            - Overall: O(1 * A) = O(A) for best case, O(A * N) = O(N * A) for worst case.
+            - Binary searches the running total of guardians for the last site that is fully invaded. >> O(log N)
+            - Best case = O(A * log N) = O(A log N) when no site is pending.
+            - Worst case = O(N + P log P + A log N) when sites are pending.
        
-       update_site() -> O(log N)
-            - Finds the node to delete and update it back to the BST.
-            - O(log N) when the deletion and updating is done at the BST regardless of balance property.
+       update_site() -> O(log N + E)
+            - Binary searches the old ratio and marks the site as pending. >> O(log N)
+            - Picks the site out of the E sites sharing its ratio by identity. >> O(E)
+            - The arrays are only rebuilt by the next selection, so P updates in a row share one rebuild.
+       
+       _apply_pending_updates() -> O(N + P log P)
+            - Removes the P pending sites from the sorted sites in a single pass. >> O(N)
+            - Appends the pending sites and sorts again; the built-in sort merges the still sorted sites with the sorted pending ones. >> O(N + P log P)
+            - Splits the sites into the parallel arrays and recomputes the running totals once. >> O(N)
     """
 
     def __init__(self, sites: list[Land], adventurers: int) -> None:
@@ -72,14 +84,13 @@ class Mode1Navigator:
        
        COMPLEXITY ANALYSIS
        :variable: N -> The number of Land objects present in a list container.
-       :best/worst complexity: O(N log N) -> The method sorts the list of Land objects and appends the items to the BST by adding the median object, items left to the median, and items right to the median. We are assuming the depth of a BST is bounded by O(log N), yielding to the complexity being the same for best and worst regardless of balance property.
+       :best/worst complexity: O(N log N) -> The method sorts the list of Land objects and splits them into parallel arrays of ratios, gold and guardians in a single pass, see _build_arrays().
        """
        
-       # sorting the list based on the unique ratio.
-       sorted_sites: list[Land] = mergesort(l=sites, key=lambda x: x.get_guardians() / x.get_gold()) # O(N log N)
-       
-       # initialising states.
-       self.sites: BinarySearchTree = self._create_bst(l=sorted_sites) # O(N log N)
+       # sorting the list based on the ratio, lands with equal ratios keep their given order.
+       # initialising states as parallel arrays sorted by the ratio.
+       self._build_arrays(sorted(sites, key=Land.get_ratio)) # O(N log N)
+       self._pending: dict[int, int] = {}
        self.total_adventurers: int = adventurers
 
     def select_sites(self) -> list[tuple[Land, int]]:
@@ -89,41 +100,38 @@ class Mode1Navigator:
         :returns: (list) -> A list of tuples that contains the Land objects visited with the optimal number of adventurers sent.
         
         COMPLEXITY ANALYSIS
-        :variable: N -> Number of Land objects present inside the BST.
-        :best complexity: O(1) -> When the deepest left leaf node contains a Land object with greater than or equal to the total adventurers that the navigator has. The method will stop the while loop after one iteration.
-        :worst complexity: O(N) -> When the navigator has enough adventurers to visit all the Lands to collect gold. This involves the method travelling towards all the N nodes present inside the BST.
+        :variable: N -> Number of Land objects present inside the arrays.
+        :variable: P -> Number of Land objects updated since the last selection.
+        :best complexity: O(1) -> When no Land object is pending and the first Land object has greater than or equal to the total adventurers that the navigator has. The method will stop the loop after one iteration.
+        :worst complexity: O(N + P log P) -> When P Land objects are pending, they are re-inserted into the arrays first in O(N + P log P), see _apply_pending_updates(). The navigator then has enough adventurers to visit all the Lands to collect gold, which involves the method scanning all the N entries of the arrays.
         """
         
+        # re-inserting any site updated since the last selection.
+        if self._pending:
+            self._apply_pending_updates() # O(N + P log P)
+        
         # storing the final list of tuples.
         res_tuples: list[tuple[Land, int]] = []
         
         # keeping track of the adventurers.
         remaining_adventurers: int = self.total_adventurers
-
-        # creating an iterator.
-        bst_iter: BSTInOrderIterator = iter(self.sites)
         
-        # loop while there are adventurers remaining.
-        while remaining_adventurers > 0: # O(N)
+        # scanning the sites in ratio order.
+        for site, guardians in zip(self.sites, self.guardians): # O(N)
             
-            # initial state of site.
-            site_node: TreeNode[float, Land] = None
-            
-            # try to fetch the next node or stop iteration if exhausted.
-            try:
-                site_node = next(bst_iter) # Amortized O(1)
-            except (StopIteration):
-                return res_tuples
+            # stop once every adventurer has been sent.
+            if remaining_adventurers <= 0:
+                break
             
             # calculating optimal adventurers needed for invasion.
-            minimum_adventurers_required: int = min(remaining_adventurers, site_node.item.get_guardians())
+            minimum_adventurers_required: int = min(remaining_adventurers, guardians)
             
             # append and update.
-            res_tuples.append((site_node.item, minimum_adventurers_required))
+            res_tuples.append((site, minimum_adventurers_required))
             remaining_adventurers -= minimum_adventurers_required
-
+        
         # return final optimal path.
-        return res_tuples    
+        return res_tuples
 
     def select_sites_from_adventure_numbers(self, adventure_numbers: list[int]) -> list[float]:
         """
@@ -132,41 +140,44 @@ class Mode1Navigator:
         :returns: (list) -> A list of maximum rewards.
         
         COMPLEXITY ANALYSIS
-        :variable: N -> The number of land sites available in the BST.
+        :variable: N -> The number of land sites available in the arrays.
         :variable: A -> The number of total adventurer elements in the list container.
-        :best complexity: O(A) -> When the deepest leaf node contains a land site that is enough to accomodate all the adventurers in all iterations of the adventure_numbers list.
-        :worst complexity: O(N * A) -> When every member from the adventure_numbers list contain with enough members to be able to invade all the land sites present in the BST. This means it iterates over N sites present in the BST.
+        :variable: P -> The number of land sites updated since the last selection.
+        :best complexity: O(A log N) -> When no land site is pending. For every member from the adventure_numbers list, the running total of guardians is binary searched for the first site that cannot be fully invaded. The gold of every site before it is read from the running total of gold, so no site is visited one by one.
+        :worst complexity: O(N + P log P + A log N) -> When P land sites are pending, they are re-inserted into the arrays first in O(N + P log P), see _apply_pending_updates(), before the A binary searches.
         """
         
+        # re-inserting any site updated since the last selection.
+        if self._pending:
+            self._apply_pending_updates() # O(N + P log P)
+        
         # storing the maximum gold reward acheived.
         res_rewards: list[float] = []
         
-        # storing the instance variable total_adventurers temporarily.
-        temp: int = self.total_adventurers
-        
         # iterate through each total adventurer element.
         for current_advs in adventure_numbers: # O(A)
             
-            # reusing self.sites() to calculate reward
-            self.total_adventurers = current_advs
-            optimal_path: list[tuple[Land, int]] = self.select_sites() # O(1) | O(N)
+            # no adventurers means no site is invaded.
+            if current_advs <= 0:
+                res_rewards.append(0)
+                continue
             
-            # calculating the reward achieved.
-            total_reward: float = 0
+            # finding the first site that cannot be fully invaded.
+            index: int = bisect_left(self.guardians_prefix, current_advs) # O(log N)
             
-            for (land, adv) in optimal_path:
-                
-                # calculating and rounding.
-                reward: float = min(adv * land.get_gold()/land.get_guardians(), land.get_gold())
-                total_reward += reward
+            # gold from every fully invaded site before it.
+            total_reward: float = self.gold_prefix[index - 1] if index > 0 else 0
+            
+            # partially invading the site with the remaining adventurers.
+            if index < len(self.sites):
+                remaining_adventurers: int = current_advs - (self.guardians_prefix[index - 1] if index > 0 else 0)
+                gold: float = self.gold[index]
+                total_reward += min(remaining_adventurers * gold / self.guardians[index], gold)
             
             res_rewards.append(total_reward)
         
-        # restoring state.
-        self.total_adventurers = temp
-
         return res_rewards
-    
+
     def update_site(self, land: Land, new_reward: float, new_guardians: int) -> None:
         """
         :description: Behaviour that updates the state of the Land site.
@@ -176,69 +187,88 @@ class Mode1Navigator:
         :returns: void.
         
         COMPLEXITY ANALYSIS
-        :variable: N -> The number of land sites inside the BST.
-        :best/worst complexity: O(log N) -> The land site is found at the the BST, updated, and inserted back at the BST. We are still assuming that the depth of BST is bounded by O(log N), making the worst and best case complexity the same regardless of balance property.
+        :variable: N -> The number of land sites inside the arrays.
+        :variable: E -> The number of land sites sharing the ratio of the land site.
+        :best complexity: O(1) -> When the land site is already waiting to be re-inserted, its index is known.
+        :worst complexity: O(log N + E) -> The land site is found by binary searching its ratio, then picked out of the E land sites sharing that ratio. The arrays are not touched until the next selection, which re-inserts every pending site at once.
         """
         
-        # getting the land object from the bst.
-        key: float = land.get_guardians() / land.get_gold()
-        del self.sites[key] # O(log N)
+        # finding the land object in the arrays, unless it is already pending.
+        if id(land) not in self._pending:
+            key: float = land.get_ratio()
+            
+            # different lands can share a ratio, so the land is told apart from them by identity.
+            start: int = bisect_left(self.ratios, key) # O(log N)
+            end: int = bisect_right(self.ratios, key, start) # O(log N)
+            
+            for index in range(start, end): # O(E)
+                if self.sites[index] is land:
+                    break
+            else:
+                raise ValueError('Updating non-existent site')
+            
+            self._pending[id(land)] = index
         
         # updating the land object.
-        land.gold = new_reward
-        land.guardians = new_guardians
-        
-        # adding the land back to the bst with the new key.
-        key = land.get_guardians() / land.get_gold()
-        self.sites[key] = land # O(log N)
-    
-    def _create_bst(self, l: list[Land]) -> BinarySearchTree:
+        land.set_gold(new_reward)
+        land.set_guardians(new_guardians)
+
+    def _apply_pending_updates(self) -> None:
         """
-        :description: Protected method to construct a BST for self.sites.
-        :param: l (list) -> A list of Land objects.
-        :returns: (BinarySearchTree) -> A BST of Land objects.
+        :description: Protected method to re-insert every updated land site into the parallel arrays.
+        :param: void.
+        :returns: void.
         
         COMPLEXITY ANALYSIS
-        :variable: N -> The number of Land objects present in a list container.
-        :best/worst complexity: O(N log N) -> The method appends the median Land object first, and then iterates over items left to the median, and then iterates over items right to the median. We are assuming the depth of BST is always bounded by O(log N), making the complexity case the same for best/worst.
+        :variable: N -> The number of land sites inside the arrays.
+        :variable: P -> The number of land sites updated since the last rebuild.
+        :best/worst complexity: O(N + P log P) -> The stale entries are dropped in a single pass over the sites. The pending land sites are appended and all sites sorted again, which the built-in sort does by sorting the P appended ones and merging them with the N already sorted ones. The arrays are then built once from the sites.
         """
         
-        # creating a resultant bst.
-        res_bst: BinarySearchTree = BinarySearchTree()
+        # pending sites in the order they were updated.
+        updated: list[Land] = [self.sites[index] for index in self._pending.values()]
         
-        # finding the median value to serve as root node.
-        median_index: int = len(l) // 2
+        # removing the stale entries in a single pass.
+        keep: list[bool] = [True] * len(self.sites)
+        for index in self._pending.values(): # O(P)
+            keep[index] = False
         
-        # create and put root node.
-        item = l[median_index]
-        key = item.get_guardians() / item.get_gold()
+        sites: list[Land] = list(compress(self.sites, keep)) # O(N)
+        self._pending.clear()
         
-        res_bst[key] = item
+        # adding the lands back after the others and sorting with their new keys.
+        # the sort is stable, so each land goes after the ones with an equal ratio, in the order they were updated.
+        sites.extend(updated) # O(P)
+        sites.sort(key=Land.get_ratio) # O(N + P log P)
         
-        # put the rest of the elements accordingly.
-        self._append_to_bst(bst=res_bst, l=l, start=median_index-1, end=-1, incrementer=-1) # O(N log N)
-        self._append_to_bst(bst=res_bst, l=l, start=median_index+1, end=len(l), incrementer=1) # O(N log N)
+        # rebuilding the arrays and the running totals.
+        self._build_arrays(sites) # O(N)
+
+    def _build_arrays(self, sorted_sites: list[Land]) -> None:
+        """
+        :description: Protected method to split the land sites sorted by ratio into the parallel arrays and their running totals.
+        :param: sorted_sites (list) -> The Land objects sorted by guardians-to-gold ratio.
+        :returns: void.
         
-        return res_bst
-    
-    def _append_to_bst(self, bst:BinarySearchTree, l: list[Land], start: int, end: int, incrementer: int) -> None:
+        COMPLEXITY ANALYSIS
+        :variable: N -> The number of land sites given.
+        :best/worst complexity: O(N) -> Each array is filled in a single pass over the sites, followed by the running totals.
         """
-        :description: Protected method to append items to the BST.
-        :param: bst (BinarySearchTree) -> The BST of items to be returned.
-        :param: l (list) -> A list of Land objects.
-        :param: start (int) -> Starting index of the list.
-        :param: end (int) -> Ending index of the list.
-        :param: incrementer (int) -> Step variable to increment.
+        self.sites: list[Land] = sorted_sites
+        self.ratios: list[float] = [site.get_ratio() for site in sorted_sites] # O(N)
+        self.gold: list[float] = [site.get_gold() for site in sorted_sites] # O(N)
+        self.guardians: list[int] = [site.get_guardians() for site in sorted_sites] # O(N)
+        self._compute_prefix_sums() # O(N)
+
+    def _compute_prefix_sums(self) -> None:
+        """
+        :description: Protected method to recompute the running totals of guardians and gold.
+        :param: void.
         :returns: void.
         
         COMPLEXITY ANALYSIS
-        :variable: N -> The number of Land objects present in a list container.
-        :best/worst complexity: O(N log N) -> The method iterates over N land objects and adds them to the BST. We are assuming the depth of BST is bounded by O(log N) so the complexity case will be the same for best/worst.
+        :variable: N -> The number of land sites inside the arrays.
+        :best/worst complexity: O(N) -> Both running totals are accumulated in a single pass over the arrays.
         """
-        # looping through the list before/after the median.
-        for i in range(start, end, incrementer): # O(N)
-            
-            # adding nodes to the bst.
-            item = l[i]
-            key = item.get_guardians() / item.get_gold()
-            bst[key] = item # O(log N)
+        self.guardians_prefix: list[int] = list(accumulate(self.guardians)) # O(N)
+        self.gold_prefix: list[float] = list(accumulate(self.gold)) # O(N)
@@ -1,26 +1,114 @@
-from data_structures.heap import MaxHeap
+from heapq import heapify, heappush, heapreplace
+from itertools import repeat
 from landsites import Land
-from heap_node import HeapNode
-from data_structures.referential_array import ArrayR
+
+def _compute_score(gold: float, guardians: int, adventurers_size: int) -> tuple[float, float, int]:
+    """
+    :description: Computes o-scores, remaining adventurers, and reward gained from the raw fields of a land.
+    :param: gold (float) -> The gold present at the land.
+    :param: guardians (int) -> The guardians present at the land.
+    :param: adventurers_size (int) -> The adventurer total to invade the land.
+    :returns: (tuple) -> A tuple of final land o-score, reward, and remaining adventurers
+    
+    COMPLEXITY ANALYSIS
+    :best/worst complexity: O(1) -> Only the branch for the number of guardians of the land runs, in constant time.
+    """
+    
+    # the whole team is needed, nobody is left over and only a share of the gold, which is the o-score, is earned.
+    if guardians > adventurers_size:
+        reward_earned: float = adventurers_size*gold/guardians
+        return reward_earned, reward_earned, 0
+    
+    # every guardian is beaten, earning all the gold, and a land without guardians yields no reward.
+    remaining_adventurers: int = adventurers_size - guardians
+    reward_earned = gold if guardians else 0
+    return 2.5 * remaining_adventurers + reward_earned, reward_earned, remaining_adventurers
+
+def _play_teams(heap: list[tuple[float, int]], gold: list[float], guardians: list[int], adventurers_size: int, n_teams: int) -> list[tuple[int | None, int]]:
+    """
+    :description: Plays a day for every team on raw arrays, updating the gold and guardians of the invaded lands and the heap in place.
+    :param: heap (list) -> A heapq heap of (negated o-score, index) tuples of the lands.
+    :param: gold (list) -> The gold of each land, by index.
+    :param: guardians (list) -> The guardians of each land, by index.
+    :param: adventurers_size (int) -> The total adventurer size for each team.
+    :param: n_teams (int) -> The number of teams playing the game.
+    :returns: (list) -> A list of tuples of the index of the land each team went to (None if it stayed) and how many adventurers it sent.
+    
+    COMPLEXITY ANALYSIS
+    :variable: N -> The number of lands inside the heap.
+    :variable: K -> The number of teams playing the game.
+    :best complexity: O(K) -> The land at the root is invaded by every team, or no land is worth invading. The heap is then sifted at most once.
+    :worst complexity: O(K log N) -> After every team the updated land is beaten by the runner-up, so its o-score is sifted down the heap using heapreplace() for each of the K teams.
+    """
+    
+    # storing resultant tuples.
+    res_tuples: list[tuple[int | None, int]] = []
+    
+    minimum_score: float = 2.5 * adventurers_size
+    
+    # playing the game with k teams.
+    teams_left: int = n_teams
+    while teams_left > 0: # O(K)
+        
+        # if even the maximum o-score is not more than the minimum o-score, no team invades for the rest of the day.
+        if not heap or -heap[0][0] <= minimum_score:
+            res_tuples.extend([(None, 0)] * teams_left)
+            break
+        
+        # index of the maximum o-score land, and the entry it has to keep beating to take the next team too.
+        index: int = heap[0][1]
+        runner_up: tuple[float, int] | None = min(heap[1:3]) if len(heap) > 1 else None
+        
+        # compute the remainining adventurers and gold retrieved.
+        _, reward_earned, remaining_adventurers = _compute_score(gold[index], guardians[index], adventurers_size)
+        
+        # sending teams to the land until its o-score is beaten, without touching the heap.
+        while True: # O(K)
+            adventurers_sent: int = adventurers_size - remaining_adventurers
+            
+            # append the result to the list.
+            res_tuples.append((index, adventurers_sent))
+            teams_left -= 1
+            
+            # updating the land accordingly, the new o-score also gives what the next team would earn.
+            guardians[index] -= adventurers_sent
+            gold[index] = max(0, gold[index] - reward_earned)
+            o_score, reward_earned, remaining_adventurers = _compute_score(gold[index], guardians[index], adventurers_size)
+            entry: tuple[float, int] = (-o_score, index)
+            
+            if teams_left == 0 or o_score <= minimum_score or (runner_up is not None and runner_up < entry):
+                break
+        
+        # sifting the land to its new place in the heap.
+        heapreplace(heap, entry) # O(log N)
+    
+    # return list.
+    return res_tuples
 
 class Mode2Navigator:
     """
     A class to manage and navigate through a collection of Land objects for obtaining maximum o-score.
     
     Attributes
-        sites (MaxHeap): A heap containing Land objects ordered in terms of o-scores.
-        sites_temp (ArrayR): An array that keeps track of all land objects inserted to the program.
+        sites (list): A heapq heap of (negated o-score, index) tuples, the index being that of the Land object in sites_temp.
+        _heap_adventurer_size (int): The adventurer total the o-scores in the heap were computed for, None before the first day.
+        sites_temp (list): A list that keeps track of all land objects inserted to the program.
+        gold (list): The gold of each land object, parallel to sites_temp. Read from the Land objects whenever the heap is built, then updated by the teams and written back to the invaded Land objects.
+        guardians (list): The guardians of each land object, parallel to sites_temp, kept like gold.
         n_teams (int): Keeps track of the number of teams in the game.
         
     Behaviours
-        __init__(self, n_teams): Initialises the class with the number of teams in the game, and nulls both the heap structure and array structure to store contents later.
-        add_sites(self, sites): Adds sites to the array to keep track of the Land objects that could be invaded in the game.
+        __init__(self, n_teams): Initialises the class with the number of teams in the game, nulls the heap structure and creates an empty list to store contents later.
+        add_sites(self, sites): Adds sites to the list to keep track of the Land objects that could be invaded in the game.
         simulate_day(self, adventurer_size): Simulates the game that runs for a day, involving teams to travel to optimise their o-score earnings.
         compute_score(self, site, adventurers_size): Computes the o-score for a land, the remaining adventurers and gold earned for each team.
         construct_score_data_structure(self, adventurer_size): Constructs the heap with the given array from the class' attribute.
     
     Other methods
-        _update_site(self, land, reward_lost, guardians_lost, adventurer_size): Updates the fields of the Land object and the HeapNode within the MaxHeap.
+        _sync_sites(self): Reads the gold and guardians of every Land object into the arrays, telling whether a land changed since they were last read.
+        _build_heap(self, adventurer_size): Scores every land from the arrays and heapifies the o-scores.
+        _push_new_sites(self, adventurer_size): Pushes the o-scores of the lands added since the last day onto the heap kept from it.
+        _update_site(self, index): Writes the gold and guardians of a land from the arrays back to its Land object.
    
     Example
         >>> sites = [ Land('A', 400, 100), Land('B', 750, 120), Land('C', 200, 30) ]
@@ -37,32 +125,40 @@ class Mode2Navigator:
         __init__() -> O(1)
             - All instance variables are instantiated in O(1) of complexity.
         
-        add_sites() -> O(N + S)
-            - The method creates a new array of size N + S. >> O(N + S)
-            - The method iterates over N items from the old array. >> O(N)
-            - The method iterates over S new items from the sites list. >> O(S)
-            - Overall: N + S + N + S = 2 * N + 2 * S => O(N + S) as 2 is a constant.
+        add_sites() -> O(S) amortised
+            - The method extends the list with S new items from the sites list. >> O(S) amortised
+            - The N existing items are only moved when the list grows its capacity, which happens geometrically.
         
         compute_score() -> O(1)
             - The method calculates the o-score of a land, the remaining adventurers, and gold invaded in constant time.
         
         construct_score_data_structure() -> O(N)
-            - Creates a new array of size N. >> O(N)
-            - Looping through each element to convert it to a HeapNode object. >> O(N)
-            - Heapifying the array formed after conversion. >> O(N)
-            - Overall: N + N + N = 3 * N => O(N) as 3 is a constant.
-        
-        simulate_day() -> O(N + K) to O(N + K log N)
-            - Creates a Max heap of Heap Node objects. >> O(N)
-            - Loops through each team. >> O(K)
-            - MaxHeap.get_max()
-                - Best case = O(1) -> When the child Heap Node is equal to one of its children.
-                - Worst case = O(log N) -> When the child Heap node is smaller than all of its descendants, resulting in sinking to the depth of the heap.
-            - Mode2Navigator._update_site()
-                - Best case = O(1) -> When the child added to the heap is equal to its parent.
-                - Worst case = O(log N) -> When the child added to the heap is the most maximum element, resulting in complete rise to the root.
+            - Reading the gold and guardians of each element into the arrays, in _sync_sites(). >> O(N)
+            - Scoring and heapifying the elements, in _build_heap(). >> O(N)
+            - Overall: N + N = 2 * N => O(N) as 2 is a constant.
+        
+        simulate_day() -> O(N + S log N + K) to O(N + K log N)
+            - Reads the gold and guardians of every Land object into the arrays. >> O(N)
+            - Keeps the heap of the last day when the adventurer total and its lands are unchanged, pushing the S lands added since. >> O(S log N)
+            - Otherwise creates a Max heap of o-scores. >> O(N)
+            - Loops through each team on the arrays, in _play_teams(). >> O(K)
+            - The land at the root keeps taking teams while its updated o-score still beats the runner-up, without touching the heap. >> O(1)
+            - heapq.heapreplace() once the root land is beaten or stops being worth invading. >> O(log N)
+                - Best case = once, when one land is invaded by every team, or no land is worth invading.
+                - Worst case = K times, when a different land takes the root after every team.
             - Appending is done after every turn. >> O(1)
-            - Overall: O(N + K*(1+1)) = O(N + K) for best case, O(N + K*(log N + log N)) = O(N + K log N) for worst case.
+            - Mode2Navigator._update_site() for each invaded land, and mapping the indices to Land objects. >> O(K)
+            - Overall: O(N + S log N + K) for best case, O(N + K*(1 + log N)) = O(N + K log N) for worst case.
+        
+        _sync_sites() -> O(N)
+            - Reads the fields of every Land object and compares them with the arrays read before. >> O(N)
+        
+        _build_heap() -> O(N)
+            - Computing the o-score of every element in a single pass with _compute_score(), the scorer the teams use. >> O(N)
+            - Heapifying the o-scores. >> O(N)
+        
+        _push_new_sites() -> O(S log N)
+            - Computes the o-score of each of the S new lands and pushes it onto the heap. >> O(S log N)
     """
 
     def __init__(self, n_teams: int) -> None:
@@ -75,46 +171,27 @@ class Mode2Navigator:
         :best/worst complexity: O(1) -> The constructor initialises the states of the instance variables in constant time.
         """
         
-        self.sites: MaxHeap = None
-        self.sites_temp: ArrayR = None
+        self.sites: list[tuple[float, int]] = None
+        self._heap_adventurer_size: int = None
+        self.sites_temp: list[Land] = []
+        self.gold: list[float] = []
+        self.guardians: list[int] = []
         self.n_teams: int = n_teams
 
     def add_sites(self, sites: list[Land]) -> None:
         """
-        :description: Behaviour that adds the sites to an array.
+        :description: Behaviour that adds the sites to a list.
         :param: sites (list) -> A list of Land objects.
         :returns: void.
         
         COMPLEXITY ANALYSIS
-        :variable: S -> Additional Land objects to be inserted to the array.
-        :variable: N -> Existing land objects inside the array.
-        :best/worst complexity: O(N + S) -> Where there are new S land objects to be added to the new array of size N + S. The program involves creating a new array in O(N + S) complexity to accomodate space to iterate and insert N items into the array, followed by additonal S new items into the array.
+        :variable: S -> Additional Land objects to be inserted to the list.
+        :variable: N -> Existing land objects inside the list.
+        :best/worst complexity: O(S) amortised -> The S new land objects are appended after the existing ones. The list over-allocates geometrically, so the N existing items are only copied when its capacity runs out, which amortises to O(1) per appended item.
         """
         
-        
-        # if array is empty, create a new one with length of sites.
-        if not self.sites_temp:
-            
-            self.sites_temp = ArrayR(len(sites))
-            
-            # traverse through the list to add the items.
-            for i in range(len(self.sites_temp)): # O(S)
-                self.sites_temp[i] = sites[i]
-
-        # if items already exist.
-        else:
-            
-            # store old array temporarily and create new array.
-            old_array = self.sites_temp
-            self.sites_temp = ArrayR(len(old_array) + len(sites)) # O(N + S)
-            
-            # restore old items.
-            for _ in range(len(old_array)): # O(N)
-                self.sites_temp[_] = old_array[_]
-            
-            # add new items.
-            for i in range(len(sites)): #O(S)
-                self.sites_temp[len(old_array) + i] = sites[i]
+        # add new items after the existing ones.
+        self.sites_temp.extend(sites) # O(S) amortised
 
     def simulate_day(self, adventurer_size: int) -> list[tuple[Land | None, int]]:
         """
@@ -124,47 +201,36 @@ class Mode2Navigator:
         
         COMPLEXITY ANALYSIS
         :variable: N -> The number of land objects inside the array.
+        :variable: S -> The number of land objects added since the last day.
         :variable: K -> The number of teams playing the game.
-        :best complexity: O(N + K) -> This occurs when the max heap construction has been made for the game to be played, and all the HeapNodes have the same o-score which means every time someone get_max() a node, it won't involve the child node to sink since its equal to one of its parents. Same goes with add() as it will just stay in the leaf on the depth of the heap.
-        :worst complexity: O(N + K log N) -> This occurs when the max heap construction has been made for the game to be played, and the heap nodes sink down everytime the root node is accessed using get_max() and the updated heap node rises back up to the root due to having a higher o-score than other nodes.
+        :best complexity: O(N + S log N + K) -> The fields of every land are read into the arrays. The adventurer total and the lands are the same as the last day's, so its heap is kept and only the S new lands are pushed onto it. The land at the root is then invaded by every team (e.g. a land whose guardians outnumber the adventurers of K teams, so that each team leaves its gold-to-guardians ratio and o-score unchanged), or no land is worth invading. The heap is then sifted at most once.
+        :worst complexity: O(N + K log N) -> The max heap construction is made for the game to be played, and after every team the updated land is beaten by the runner-up, so its o-score is sifted down the heap using heapreplace() for each of the K teams.
         """
         
-        # storing resultant tuples.
-        res_tuples: list[tuple[Land | None, int]] = []
+        # the Land objects may have been changed by the caller since the last day.
+        lands_changed: bool = self._sync_sites() # O(N)
         
-        # constructing a max heap using the array of Land objects
-        self.sites = self.construct_score_data_structure(adventurer_size) # O(N)
-
-        # playing the game with k teams.
-        for _ in range(self.n_teams): # O(K)
-            
-            # resultant tuple to store what Land each team went, with how many adventurers they sent.
-            res: tuple[Land | None, int] = (None, 0)
-            
-            # maximum o-score land retrieved.
-            heap_node: HeapNode = self.sites.get_max() # O(1) | O(log N)
-            
-            # getting the land and o-score
-            current_land: Land = heap_node.get_land()
-            current_score: float = heap_node.get_score()
-            
-            # if the o-score from the land is more than the minimum o-score, then invade.
-            if current_score > 2.5 * adventurer_size:
-                
-                # compute the remainining adventurers and gold retrieved.
-                result = self.compute_score(current_land, adventurer_size)
-                
-                # resultant tuple.
-                res = (current_land, adventurer_size - result[2])
-                
-                # updating the sites accordingly.
-                self._update_site(current_land, result[1], (adventurer_size - result[2]) , adventurer_size) # O(1) | O(log N)
-            
-            # append the result to the list.
-            res_tuples.append(res)
+        # the heap of the last day still holds the o-scores of its lands for the same adventurer total, as each invaded land is put back with its new o-score.
+        # a land changed by the caller has a stale o-score in it, so the heap is rebuilt.
+        # it is only kept while the new lands are fewer than the ones already in it, otherwise heapifying everything is cheaper.
+        heap: list[tuple[float, int]] = self.sites
+        if heap is not None and not lands_changed and adventurer_size == self._heap_adventurer_size and 2 * len(heap) >= len(self.sites_temp):
+            self._push_new_sites(adventurer_size) # O(S log N)
+        else:
+            # constructing a max heap using the arrays just read.
+            self.sites = self._build_heap(adventurer_size) # O(N)
+            self._heap_adventurer_size = adventurer_size
         
-        # return list.
-        return res_tuples
+        # playing the game with k teams on the arrays.
+        plays: list[tuple[int | None, int]] = _play_teams(self.sites, self.gold, self.guardians, adventurer_size, self.n_teams) # O(K) | O(K log N)
+        
+        # writing the invaded lands back to their Land objects.
+        for index in dict.fromkeys(index for index, _ in plays if index is not None): # O(K)
+            self._update_site(index)
+        
+        # resultant tuples of where each team went, with how many adventurers they sent.
+        sites_temp: list[Land] = self.sites_temp
+        return [(sites_temp[index] if index is not None else None, adventurers_sent) for index, adventurers_sent in plays] # O(K)
             
     def compute_score(self, site: Land, adventurers_size: int) -> tuple[float, float, int]:
         """
@@ -176,63 +242,100 @@ class Mode2Navigator:
         COMPLEXITY ANALYSIS
         :best/worst complexity: O(1) -> All operations done here are in constant time, making it overall of O(1).
         """
+        return _compute_score(site.gold, site.guardians, adventurers_size)
+
+    def construct_score_data_structure(self, adventurer_size) -> list[tuple[float, int]]:
+        """
+        :description: Behaviour that constructs a heap for the simulation.
+        :param: adventurer_size (int) -> The total adventurer number to invade a land.
+        :returns: (list) -> A heapq heap of the negated o-scores yielded by different lands, each paired with the index of its land. The index also breaks ties between equal o-scores.
         
-        # getting minimum adventurers needed for invasion.
-        minimum_adventurers_needed: int = min(site.get_guardians(), adventurers_size)
+        COMPLEXITY ANALYSIS
+        :variable: N -> The number of land objects present inside the list.
+        :best/worst complexity: O(N) -> The method reads the fields of each item in the list, computing its o-score. The o-scores are later heapified in O(N) complexity cost.
+        """
         
-        # getting maximum reward earned.
-        try:
-            reward_earned: float = min(minimum_adventurers_needed*site.get_gold()/site.get_guardians(), site.get_gold())
-        except ZeroDivisionError:
-            reward_earned = 0
+        # the Land objects may have been changed by the caller since the arrays were last read.
+        self._sync_sites() # O(N)
+        return self._build_heap(adventurer_size) # O(N)
 
-        # calculating remaining adventurers and o-score
-        remaining_adventurers: int = adventurers_size - minimum_adventurers_needed
-        o_score: float = 2.5 * remaining_adventurers + reward_earned
+    def _build_heap(self, adventurer_size: int) -> list[tuple[float, int]]:
+        """
+        :description: Protected method that scores every land from the arrays and heapifies the o-scores.
+        :param: adventurer_size (int) -> The total adventurer number to invade a land.
+        :returns: (list) -> A heapq heap of the negated o-scores yielded by different lands, each paired with the index of its land.
+        
+        COMPLEXITY ANALYSIS
+        :variable: N -> The number of land objects inside the arrays.
+        :best/worst complexity: O(N) -> The o-score of each land is computed in a single pass over the arrays, and the o-scores are heapified in O(N).
+        """
         
-        # returning calculations.
-        return o_score, reward_earned, remaining_adventurers
+        gold: list[float] = self.gold
+        guardians: list[int] = self.guardians
+        
+        # computing the o-score of each Land object, the i-th o-score belongs to the i-th land.
+        # the teams score lands with the same function, so equal o-scores always tie the same way.
+        scores: list[float] = [o_score for o_score, _, _ in map(_compute_score, gold, guardians, repeat(adventurer_size))] # O(N)
+        
+        # negate the o-scores so the smallest entry of the heapq heap is the maximum o-score.
+        heap: list[tuple[float, int]] = [(-score, index) for index, score in enumerate(scores)] # O(N)
+        heapify(heap) # O(N)
+        return heap
 
-    def construct_score_data_structure(self, adventurer_size) -> MaxHeap:
+    def _sync_sites(self) -> bool:
         """
-        :description: Behaviour that constructs a heap for the simulation.
-        :param: adventurer_size (int) -> The total adventurer number to invade a land.
-        :returns: (MaxHeap) -> A heap that is ordered based on the o-score yielded by different lands.
+        :description: Protected method that reads the gold and guardians of every Land object into the arrays.
+        :param: void.
+        :returns: (bool) -> Whether any land that was already in the arrays has different gold or guardians than they hold.
         
         COMPLEXITY ANALYSIS
-        :variable: N -> The number of land objects present inside the list.
-        :best/worst complexity: O(N) -> The method iterates over each item in the list, converting it to a HeapNode item. The array is later heapified in O(N) complexity cost.
+        :variable: N -> The number of land objects inside the list.
+        :best/worst complexity: O(N) -> The fields of each land are read once, so scoring and the day's updates do not go through the Land objects. The arrays read before are compared with the new ones in a single pass.
         """
+        
+        sites_temp: list[Land] = self.sites_temp
+        gold: list[float] = [site.gold for site in sites_temp] # O(N)
+        guardians: list[int] = [site.guardians for site in sites_temp] # O(N)
+        
+        # lands added since the arrays were last read are not in them, so only the lands before them are compared.
+        n_known: int = len(self.gold)
+        changed: bool = gold[:n_known] != self.gold or guardians[:n_known] != self.guardians # O(N)
+        
+        self.gold = gold
+        self.guardians = guardians
+        return changed
 
-        # creating a temporary array of HeapNode objects to be stored inside MaxHeap.
-        arr = ArrayR(len(self.sites_temp))
-        
-        # looping through each Land object and converting it to HeapNode.
-        for i in range(len(arr)): # O(N)
-            arr[i] = self.sites_temp[i]
-            res = self.compute_score(arr[i], adventurer_size)
-            arr[i] = HeapNode(arr[i], res[0])
-           
-        # heapify the array and return a MaxHeap
-        return MaxHeap.heapify(points=arr) # O(N)
+    def _push_new_sites(self, adventurer_size: int) -> None:
+        """
+        :description: Protected method that pushes the o-scores of the lands added since the last day onto its heap.
+        :param: adventurer_size (int) -> The total adventurer number to invade a land, the same as the last day's.
+        :returns: void.
+        
+        COMPLEXITY ANALYSIS
+        :variable: N -> The number of land objects inside the heap.
+        :variable: S -> The number of land objects added since the last day.
+        :best/worst complexity: O(S log N) -> The heap holds one entry per land, so the new lands are the ones after its size in sites_temp. Each of their o-scores is pushed onto the heap in O(log N).
+        """
+        
+        heap: list[tuple[float, int]] = self.sites
+        gold: list[float] = self.gold
+        guardians: list[int] = self.guardians
+        
+        for index in range(len(heap), len(self.sites_temp)): # O(S)
+            o_score, _, _ = _compute_score(gold[index], guardians[index], adventurer_size)
+            heappush(heap, (-o_score, index)) # O(log N)
 
-    def _update_site(self, land: Land, reward_lost: int, guardians_lost: int, adventurer_size: int) -> None:
+    def _update_site(self, index: int) -> None:
         """
-        :description:  Protected method that updates the fields of a Land object and the heap.
-        :param: land (Land) -> The land object fields to be changed.
-        :param: reward_lost (int) -> The gold lost as a result of invasion.
-        :param: guardians_lost (int) -> The guardians lost as a result of invasion.
-        :param: adventurer_size (int) -> The total adventurers being sent to a land.
+        :description:  Protected method that writes the fields of a Land object back from the arrays after it was invaded.
+        :param: index (int) -> The index of the land object in sites_temp whose fields are to be changed.
         :returns: void.
         
         COMPLEXITY ANALYSIS
-        :variable: N -> The number of Land objects present inside the heap.
-        :best complexity: O(1) -> When the inserted heap node has a smaller or equal o-score value to its parent node, it is just O(1) as it involves constant access to arrays.
-        :worst complexity: O(log N) -> When the inserted heap node has a greater o-score value than all of its parent nodes, it rises up to the root.
+        :best/worst complexity: O(1) -> All operations done here are in constant time, making it overall of O(1).
         """
-        # updating land fields.
-        land.set_guardians(  land.get_guardians() - guardians_lost )
-        land.set_gold( max(0, land.get_gold() - reward_lost ) )
+        land: Land = self.sites_temp[index]
         
-        res = self.compute_score(land, adventurer_size)
-        self.sites.add(HeapNode(land, res[0])) # O(1) | O(log N)
+        # updating land fields.
+        land.set_guardians(self.guardians[index])
+        land.set_gold(self.gold[index])
@@ -109,3 +109,13 @@ class Mode1Tests(TestCase):
         nav = Mode1Navigator(self.sites, 200)
         results = nav.select_sites_from_adventure_numbers([0, 200, 500, 300, 40])
         self.assertListEqual(results, [0, 865, 1450, 1160, 240])
+
+    @number("1.7")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_updates_equal_ratios(self):
+        # Both land sites have a ratio of 0.5, only B is updated.
+        sites = [Land("A", 300, 150), Land("B", 200, 100)]
+        nav = Mode1Navigator(sites, 150)
+        nav.update_site(sites[1], 200, 1)
+        selected = nav.select_sites()
+        self.check_solution(sites, 150, selected, 498)
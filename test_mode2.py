@@ -129,3 +129,113 @@ class Mode2Tests(TestCase):
             # Score
             score = 2.5 * (100 - sent_adventurers) + received
             self.assertEqual(score, expected)
+
+    @number("2.3")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_more_teams_than_worthwhile_sites(self):
+        site = Land("L0", 458, 199)
+        nav = Mode2Navigator(7)
+        nav.add_sites([site])
+        # 69 * 458 / 199 gold is less than the 2.5 * 69 of staying, so no team invades.
+        results = nav.simulate_day(69)
+        self.assertListEqual(results, [(None, 0)] * 7)
+        self.assertEqual(site.get_gold(), 458)
+        self.assertEqual(site.get_guardians(), 199)
+
+    @number("2.4")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_one_site_takes_consecutive_teams(self):
+        a = Land("A", 1000, 300)
+        b = Land("B", 100, 100)
+        nav = Mode2Navigator(3)
+        nav.add_sites([a, b])
+        # Each team takes the same share of A's gold as of its guardians, so A's o-score stays ahead of B's for every team.
+        results = nav.simulate_day(10)
+        self.assertListEqual(results, [(a, 10)] * 3)
+        self.assertEqual(a.get_guardians(), 270)
+        self.assertAlmostEqual(a.get_gold(), 900)
+        self.assertEqual(b.get_gold(), 100)
+        self.assertEqual(b.get_guardians(), 100)
+
+    @number("2.5")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_construct_after_add_sites(self):
+        a = Land("A", 400, 100)
+        b = Land("B", 750, 120)
+        nav = Mode2Navigator(2)
+        nav.add_sites([a, b])
+        # The heap is built straight from the added lands, without a day being simulated first.
+        heap = nav.construct_score_data_structure(100)
+        self.assertEqual(len(heap), 2)
+        # Changes made to a land before the day are seen, B would otherwise go first.
+        a.set_gold(1000)
+        self.assertListEqual(nav.simulate_day(100), [(a, 100), (b, 100)])
+
+    @number("2.6")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_same_adventurers_add_sites(self):
+        self.load_basic()
+        nav = Mode2Navigator(3)
+        nav.add_sites(self.sites)
+        results_1 = nav.simulate_day(100)
+        self.assertListEqual([(site.get_name(), sent) for site, sent in results_1], [("A", 100), ("D", 90), ("C", 5)])
+        # One new land against five known ones, with the same adventurer total.
+        nav.add_sites([Land("F", 900, 150)])
+        results_2 = nav.simulate_day(100)
+        self.assertListEqual([(site.get_name(), sent) for site, sent in results_2], [("F", 100), ("F", 50), ("E", 100)])
+
+    @number("2.7")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_same_adventurers_many_new_sites(self):
+        self.load_basic()
+        nav = Mode2Navigator(2)
+        nav.add_sites([self.a])
+        results_1 = nav.simulate_day(100)
+        self.assertListEqual(results_1, [(self.a, 100), (None, 0)])
+        # Two new lands against one known land, with the same adventurer total.
+        nav.add_sites([self.d, self.e])
+        results_2 = nav.simulate_day(100)
+        self.assertListEqual(results_2, [(self.d, 90), (self.e, 100)])
+
+    @number("2.8")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_changed_site_between_days(self):
+        a = Land("A", 100, 50)
+        b = Land("B", 300, 100)
+        c = Land("C", 200, 100)
+        nav = Mode2Navigator(1)
+        nav.add_sites([a, b, c])
+        self.assertListEqual(nav.simulate_day(100), [(b, 100)])
+        # C is changed outside the navigator, so the next day has to see it.
+        c.set_gold(10000)
+        self.assertListEqual(nav.simulate_day(100), [(c, 100)])
+        self.assertEqual(c.get_gold(), 0)
+        self.assertEqual(c.get_guardians(), 0)
+
+    @number("2.9")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_days_match_new_navigator(self):
+        self.load_basic()
+        sites = list(self.sites)
+        nav = Mode2Navigator(4)
+        nav.add_sites(sites)
+        days = [
+            (100, []),
+            (100, [Land("F", 900, 150)]),
+            (100, [Land("G", 120, 40), Land("H", 500, 300)]),
+            (50, []),
+            (50, [Land("I", 400, 20)]),
+        ]
+        for adventurer_size, new_sites in days:
+            nav.add_sites(new_sites)
+            sites += new_sites
+            # A navigator given copies of the lands as they are now plays the day from scratch.
+            copies = [Land(site.get_name(), site.get_gold(), site.get_guardians()) for site in sites]
+            new_nav = Mode2Navigator(4)
+            new_nav.add_sites(copies)
+            expected = [(site.get_name() if site is not None else None, sent) for site, sent in new_nav.simulate_day(adventurer_size)]
+            results = [(site.get_name() if site is not None else None, sent) for site, sent in nav.simulate_day(adventurer_size)]
+            self.assertListEqual(results, expected)
+            for site, copy in zip(sites, copies):
+                self.assertEqual(site.get_guardians(), copy.get_guardians())
+                self.assertAlmostEqual(site.get_gold(), copy.get_gold())